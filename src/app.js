@@ -1,13 +1,17 @@
 import {dashboardShell} from './components/dashboardShell.js';
 import {getOneMonthCandles} from './polygon-candles.js';
 import {drawCandles} from './charts/candlestickChart.js';
+import {POLY_BASE} from '../public/config.js';
+
+// warm DNS/TCP/TLS to Polygon before the first candle fetch
+document.head.append(Object.assign(document.createElement('link'),{rel:'preconnect',href:POLY_BASE,crossOrigin:''}));
 
 const routes={}; const route=(p,v)=>routes[p]=v;
 
 async function render(){
  const h=location.hash.replace('#','')||'/summary';
- const el=document.getElementById('app');
- el.innerHTML=''; el.appendChild(await routes[h]());
+ const view=await routes[h]();
+ document.getElementById('app').replaceChildren(view);
 }
 
 window.addEventListener('hashchange',render);
@@ -23,13 +27,10 @@ route('/portfolio', async ()=>{
  }
  const shell=dashboardShell(`<h2>Your Portfolio</h2>${out}`);
 
- setTimeout(async()=>{
-   for(const t of tickers){
-     const data=await getOneMonthCandles(t);
-     const c=document.getElementById('c_'+t);
-     if(data) drawCandles(c,data);
-   }
- },50);
+ // draw into the shell's own canvases; no need to wait for it to be attached
+ for(const t of tickers) getOneMonthCandles(t).then(data=>{
+   if(data) drawCandles(shell.querySelector('#'+CSS.escape('c_'+t)),data);
+ }).catch(console.error);
 
  return shell;
 });
@@ -2,20 +2,25 @@ export function drawCandles(canvas,data){
  const ctx=canvas.getContext('2d');
  ctx.clearRect(0,0,canvas.width,canvas.height);
 
- const prices=data.map(d=>[d.o,d.h,d.l,d.c]).flat();
- const min=Math.min(...prices), max=Math.max(...prices);
+ // high/low bound open/close, so one pass over them gives the range
+ let min=Infinity, max=-Infinity;
+ for(const d of data){ if(d.l<min) min=d.l; if(d.h>max) max=d.h; }
  const candleWidth=canvas.width/data.length;
+ const bodyWidth=candleWidth*0.8, pad=candleWidth*0.1;
+ const H=canvas.height, k=H/(max-min);
+ const scale=y=>H-(y-min)*k;
 
+ const wicks=new Path2D(), up=new Path2D(), down=new Path2D();
  data.forEach((d,i)=>{
-   const x=i*candleWidth + candleWidth*0.1;
-   const bodyWidth=candleWidth*0.8;
-
-   const scale=y=>canvas.height - ((y-min)/(max-min))*canvas.height;
+   const x=i*candleWidth + pad, mid=x+bodyWidth/2;
    const o=scale(d.o), c=scale(d.c), h=scale(d.h), l=scale(d.l);
 
-   ctx.strokeStyle="#888"; ctx.beginPath(); ctx.moveTo(x+bodyWidth/2,h); ctx.lineTo(x+bodyWidth/2,l); ctx.stroke();
-
-   ctx.fillStyle = d.c>=d.o ? "#2ecc71" : "#e74c3c";
-   ctx.fillRect(x, Math.min(o,c), bodyWidth, Math.abs(c-o));
+   wicks.moveTo(mid,h); wicks.lineTo(mid,l);
+   (d.c>=d.o ? up : down).rect(x, Math.min(o,c), bodyWidth, Math.abs(c-o));
  });
+
+ // one stroke + two fills instead of a state change and draw call per candle
+ ctx.strokeStyle="#888"; ctx.stroke(wicks);
+ ctx.fillStyle="#2ecc71"; ctx.fill(up);
+ ctx.fillStyle="#e74c3c"; ctx.fill(down);
 }
\ No newline at end of file
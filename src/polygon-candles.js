@@ -1,10 +1,30 @@
 import {POLY_KEY,POLY_BASE} from '../public/config.js';
+import {ticker as normTicker} from './utils.js';
 
-export async function getOneMonthCandles(ticker){
+const TTL=5*60*1000; // daily bars; only today's bar moves
+const cache=new Map(); // ticker -> {at,data}
+const inflight=new Map(); // ticker -> pending fetch
+const AGGS=`${POLY_BASE}/v2/aggs/ticker/`, KEY_QS=`?apiKey=${POLY_KEY}`;
+const fmt=d=>d.toISOString().slice(0,10);
+
+async function fetchCandles(ticker){
   const end=new Date();
   const start=new Date(); start.setDate(start.getDate()-30);
-  const fmt=d=>d.toISOString().split('T')[0];
-  const url=`${POLY_BASE}/v2/aggs/ticker/${ticker}/range/1/day/${fmt(start)}/${fmt(end)}?apiKey=${POLY_KEY}`;
+  const url=`${AGGS}${ticker}/range/1/day/${fmt(start)}/${fmt(end)}${KEY_QS}`;
   const r=await fetch(url); if(!r.ok) return null;
-  const data=await r.json(); return data.results||[];
-}
\ No newline at end of file
+  const data=await r.json(); const out=data.results||[];
+  cache.set(ticker,{at:Date.now(),data:out});
+  return out;
+}
+
+export async function getOneMonthCandles(ticker){
+  ticker=normTicker(ticker); if(!ticker) return null;
+  const hit=cache.get(ticker);
+  if(hit && Date.now()-hit.at<TTL) return hit.data;
+  let p=inflight.get(ticker);
+  if(!p){
+    p=fetchCandles(ticker).finally(()=>inflight.delete(ticker));
+    inflight.set(ticker,p);
+  }
+  return p;
+}
@@ -1,4 +1,6 @@
 export const $=(s,r=document)=>r.querySelector(s);
 export const el=(t,a={},h='')=>Object.assign(document.createElement(t),a,h?{innerHTML:h}:{});
 export const store={get:k=>JSON.parse(localStorage.getItem(k)||'null'),
-set:(k,v)=>localStorage.setItem(k,JSON.stringify(v))};
\ No newline at end of file
+set:(k,v)=>localStorage.setItem(k,JSON.stringify(v))};
+const TICKER=/^[A-Za-z.\-]{1,10}$/;
+export const ticker=s=>typeof s==='string'&&TICKER.test(s)?s.toUpperCase():null;